@@ -36,6 +36,16 @@ interface Frame {
     weather?: Weather;
 }
 
+// Raw columnar frames from race_telemetry.json: one array per telemetry
+// channel instead of one object per frame
+interface FrameChannels {
+    t: number[];
+    lap: number[];
+    drivers: Record<string, Record<string, number[]>>;
+    scales?: Record<string, number>;  // decode factors for quantized channels
+    weather?: Record<string, number[]>;
+}
+
 interface Driver {
     code: string;
     number: string;
@@ -88,6 +98,48 @@ const TYRE_COMPOUNDS: Record<number, { name: string; color: string; bg: string }
     5: { name: 'WET', color: '#4444ff', bg: 'bg-blue-500' },
 };
 
+// Expand the columnar channel arrays into per-frame objects once at load time
+function decodeFrames(channels: FrameChannels): Frame[] {
+    const frames: Frame[] = [];
+    const codes = Object.keys(channels.drivers);
+    const weather = channels.weather;
+    const xScale = channels.scales?.x ?? 1;
+    const yScale = channels.scales?.y ?? 1;
+    for (let i = 0; i < channels.t.length; i++) {
+        const drivers: Record<string, DriverPosition> = {};
+        for (const code of codes) {
+            const ch = channels.drivers[code];
+            drivers[code] = {
+                x: ch.x[i] * xScale,
+                y: ch.y[i] * yScale,
+                dist: ch.dist[i],
+                lap: ch.lap[i],
+                rel_dist: ch.rel_dist[i],
+                tyre: ch.tyre[i],
+                position: ch.position[i],
+                speed: ch.speed[i],
+                gear: ch.gear[i],
+                drs: ch.drs[i],
+                throttle: ch.throttle[i],
+                brake: ch.brake[i],
+            };
+        }
+        const frame: Frame = { t: channels.t[i], lap: channels.lap[i], drivers };
+        if (weather) {
+            frame.weather = {
+                track_temp: weather.track_temp?.[i] ?? 0,
+                air_temp: weather.air_temp?.[i] ?? 0,
+                humidity: weather.humidity?.[i] ?? 0,
+                wind_speed: weather.wind_speed?.[i] ?? 0,
+                wind_direction: weather.wind_direction?.[i] ?? 0,
+                rain_state: (weather.rainfall?.[i] ?? 0) >= 0.5 ? 'RAINING' : 'DRY',
+            };
+        }
+        frames.push(frame);
+    }
+    return frames;
+}
+
 export default function ReplayPage() {
     const params = useParams();
     const year = params.year as string;
@@ -129,7 +181,10 @@ export default function ReplayPage() {
         fetch(`/data/${year}/${round}/race_telemetry.json`)
             .then(res => res.json())
             .then(data => {
-                setRaceData(data);
+                // Older datasets store frames as a per-frame object array;
+                // newer ones are columnar and need decoding
+                const frames = Array.isArray(data.frames) ? data.frames : decodeFrames(data.frames);
+                setRaceData({ ...data, frames });
                 setLoading(false);
             })
             .catch(err => {
@@ -28,26 +28,38 @@ Dependencies:
 -------------
 - fastf1: For F1 telemetry data
 - numpy/pandas: Data processing
-- urllib: For OpenF1 API calls
+- requests: For OpenF1 API calls (shared keep-alive session)
+- orjson: Fast C-level JSON encoding of the telemetry payload
 
 Author: F1 Dashboard Team
 Last Updated: December 2025
 """
 
+import diskcache
 import fastf1
 import fastf1.plotting
+import gzip
+import ijson
 import json
+import math
+import msgpack
 import numpy as np
+import orjson
 import os
 import pandas as pd
+import requests
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta, datetime
-from urllib.request import urlopen
-from urllib.error import URLError, HTTPError
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 
 # Add parent directory for imports (allows running from /python directory)
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.f1_data import get_race_telemetry, enable_cache, load_session, get_driver_colors
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(_SCRIPT_DIR))
+from src.f1_data import get_race_channels, enable_cache, load_session, get_driver_colors
 
 # Initialize FastF1 cache for faster subsequent runs
 enable_cache()
@@ -57,12 +69,52 @@ enable_cache()
 # OpenF1 API Integration for Team Radio
 # =============================================================================
 
+# Shared HTTP session so consecutive OpenF1 calls reuse one TCP/TLS connection
+# instead of paying a fresh handshake per request
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
+# On-disk cache for OpenF1 responses. Sessions and team radio for a completed
+# race never change, so repeat runs skip the HTTPS round-trips entirely.
+# Anchored to the script directory so the location doesn't depend on the CWD.
+_OPENF1_CACHE = diskcache.Cache(os.path.join(_SCRIPT_DIR, "static_data", ".openf1_cache"))
+_OPENF1_CACHE_EXPIRE = 30 * 24 * 3600  # 30 days
+
+
+def clear_openf1_cache():
+    """Drop all cached OpenF1 responses to force a refetch (--refresh-radio)."""
+    _OPENF1_CACHE.clear()
+    print("Cleared OpenF1 response cache")
+
 
 def get_openf1_session_key(year: int, round_number: int, session_type: str = 'R') -> int | None:
     """
-    Get the OpenF1 session_key for a given race session.
-    Returns None if not found (e.g., for races before 2023).
+    Get the OpenF1 session_key for a given race session, caching successful
+    lookups on disk. Returns None if not found (e.g., for races before 2023).
     """
+    cache_key = ("openf1_session_key", year, round_number, session_type)
+    cached = _OPENF1_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    session_key = _get_openf1_session_key_uncached(year, round_number, session_type)
+    # Only cache successes - a None from a transient failure must not be
+    # served for the next 30 days
+    if session_key is not None:
+        _OPENF1_CACHE.set(cache_key, session_key, expire=_OPENF1_CACHE_EXPIRE)
+    return session_key
+
+
+def _get_openf1_session_key_uncached(year: int, round_number: int, session_type: str = 'R') -> int | None:
+    # OpenF1 only covers 2023 onwards - skip the round-trip entirely
+    if year < 2023:
+        print("Skipping OpenF1 (pre-2023 season)")
+        return None
+
     # Map session types to OpenF1 session names
     session_name_map = {
         'R': 'Race',
@@ -80,23 +132,31 @@ def get_openf1_session_key(year: int, round_number: int, session_type: str = 'R'
         url = f"https://api.openf1.org/v1/sessions?year={year}&session_name={session_name}"
         print(f"Fetching OpenF1 sessions: {url}")
         
-        response = urlopen(url, timeout=10)
-        sessions = json.loads(response.read().decode('utf-8'))
-        
-        # OpenF1 doesn't have round numbers directly, so we need to find the correct meeting
-        # by counting races in order of date
-        race_sessions = sorted(sessions, key=lambda x: x.get('date_start', ''))
-        
+        with _HTTP.get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            # OpenF1 doesn't have round numbers directly, so we need to find the
+            # correct meeting by counting races in order of date. Stream-parse
+            # the season payload with ijson, keeping only the three fields we
+            # use instead of materializing every session dict.
+            # Sort on date_start only - comparing whole tuples would blow up
+            # on a None session_key if two sessions ever tie on the date
+            race_sessions = sorted(
+                ((s.get('date_start') or '', s.get('session_key'), s.get('circuit_short_name') or 'Unknown')
+                 for s in ijson.items(response.raw, 'item')),
+                key=lambda s: s[0]
+            )
+
         if round_number <= len(race_sessions):
-            session = race_sessions[round_number - 1]  # 0-indexed
-            session_key = session.get('session_key')
-            print(f"Found OpenF1 session_key: {session_key} for {session.get('circuit_short_name', 'Unknown')}")
+            _, session_key, circuit = race_sessions[round_number - 1]  # 0-indexed
+            print(f"Found OpenF1 session_key: {session_key} for {circuit}")
             return session_key
         else:
             print(f"Round {round_number} not found in OpenF1 data (only {len(race_sessions)} sessions)")
             return None
             
-    except (URLError, HTTPError) as e:
+    except requests.RequestException as e:
         print(f"Failed to fetch OpenF1 session info: {e}")
         return None
     except Exception as e:
@@ -106,18 +166,36 @@ def get_openf1_session_key(year: int, round_number: int, session_type: str = 'R'
 
 def fetch_team_radio(session_key: int, race_start_time: datetime = None) -> list:
     """
-    Fetch team radio clips from OpenF1 API for a given session.
+    Fetch team radio clips from OpenF1 API for a given session, caching
+    successful responses on disk.
     Returns a list of radio clip info with relative timestamps.
     """
     if session_key is None:
         return []
-    
+
+    cache_key = ("openf1_team_radio", session_key, race_start_time)
+    cached = _OPENF1_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    clips = _fetch_team_radio_uncached(session_key, race_start_time)
+    if clips is None:
+        # Transient failure - don't cache, retry on the next run
+        return []
+    _OPENF1_CACHE.set(cache_key, clips, expire=_OPENF1_CACHE_EXPIRE)
+    return clips
+
+
+def _fetch_team_radio_uncached(session_key: int, race_start_time: datetime = None) -> list | None:
+    """Fetch and process the radio clips. Returns None on failure so the
+    caller can distinguish an error from a session with no radio."""
     try:
         url = f"https://api.openf1.org/v1/team_radio?session_key={session_key}"
         print(f"Fetching team radio from OpenF1: {url}")
         
-        response = urlopen(url, timeout=15)
-        radio_clips = json.loads(response.read().decode('utf-8'))
+        response = _HTTP.get(url, timeout=15)
+        response.raise_for_status()
+        radio_clips = response.json()
         
         if not radio_clips:
             print("No team radio clips found for this session")
@@ -125,144 +203,259 @@ def fetch_team_radio(session_key: int, race_start_time: datetime = None) -> list
         
         print(f"Found {len(radio_clips)} team radio clips")
         
-        # Sort by timestamp
-        radio_clips = sorted(radio_clips, key=lambda x: x.get('date', ''))
-        
-        # Get the first clip time as our reference point if no race_start_time
-        if race_start_time is None and radio_clips:
-            first_time_str = radio_clips[0].get('date', '')
-            if first_time_str:
-                race_start_time = datetime.fromisoformat(first_time_str.replace('+00:00', '+00:00'))
-        
-        # Build driver number to code mapping (we'll use driver numbers from the clips)
-        processed_clips = []
-        for clip in radio_clips:
-            try:
-                clip_time_str = clip.get('date', '')
-                if not clip_time_str:
-                    continue
-                    
-                clip_time = datetime.fromisoformat(clip_time_str.replace('+00:00', '+00:00'))
-                
-                # Calculate relative time from start
-                if race_start_time:
-                    relative_time = (clip_time - race_start_time).total_seconds()
-                else:
-                    relative_time = 0
-                
-                processed_clips.append({
-                    "t": round(relative_time, 1),
-                    "driverNumber": clip.get('driver_number'),
-                    "url": clip.get('recording_url', '')
-                })
-            except Exception as e:
-                print(f"Error processing radio clip: {e}")
-                continue
-        
+        # Sort by timestamp, dropping clips without one
+        radio_clips = sorted((c for c in radio_clips if c.get('date')),
+                             key=lambda x: x['date'])
+        if not radio_clips:
+            return []
+
+        # Parse every timestamp in one vectorized C-level pass instead of a
+        # datetime.fromisoformat call per clip
+        dates = pd.to_datetime([c['date'] for c in radio_clips], utc=True,
+                               format='ISO8601', errors='coerce')
+
+        # Malformed timestamps come back as NaT - skip just those clips, like
+        # the old per-clip parser did
+        valid = dates.notna()
+        if not valid.all():
+            print(f"Skipping {int((~valid).sum())} radio clips with malformed timestamps")
+            radio_clips = [clip for clip, ok in zip(radio_clips, valid) if ok]
+            dates = dates[valid]
+            if not radio_clips:
+                return []
+
+        # The first clip is our reference point if no race_start_time was given
+        start = dates[0] if race_start_time is None else pd.Timestamp(race_start_time)
+        relative_times = (dates - start).total_seconds().round(1).tolist()
+
+        processed_clips = [
+            {
+                "t": t,
+                "driverNumber": clip.get('driver_number'),
+                "url": clip.get('recording_url', '')
+            }
+            for t, clip in zip(relative_times, radio_clips)
+        ]
+
         print(f"Processed {len(processed_clips)} radio clips with timestamps")
         return processed_clips
         
-    except (URLError, HTTPError) as e:
+    except requests.RequestException as e:
         print(f"Failed to fetch team radio: {e}")
-        return []
+        return None
     except Exception as e:
         print(f"Error fetching team radio: {e}")
-        return []
+        return None
+
+def _safe_float(obj):
+    # Handle NaN and Inf values which are not valid JSON. Cast to a native
+    # float first so math.isfinite skips the numpy ufunc dispatch entirely
+    value = float(obj)
+    if not math.isfinite(value):
+        return 0
+    return value
+
+
+def _safe_array(obj):
+    # Replace NaN values on the existing buffer - no ndarray copy
+    return np.nan_to_num(obj, copy=False, nan=0.0, posinf=0.0, neginf=0.0).tolist()
+
+
+# Exact-type dispatch table: one hash lookup per serialized object instead of
+# a chain of isinstance checks, each of which walks the MRO
+_SERIALIZERS = {
+    np.int64: int,
+    np.int32: int,
+    np.int16: int,
+    np.int8: int,
+    np.float64: _safe_float,
+    np.float32: _safe_float,
+    float: _safe_float,
+    np.ndarray: _safe_array,
+    pd.Timestamp: lambda obj: obj.isoformat(),
+    pd.Timedelta: lambda obj: obj.total_seconds(),
+    timedelta: lambda obj: obj.total_seconds(),
+}
+
 
 def convert_to_json_serializable(obj):
-    if isinstance(obj, (np.int64, np.int32, np.int16, np.int8)):
-        return int(obj)
-    elif isinstance(obj, (np.float64, np.float32, float)):
-        # Handle NaN and Inf values which are not valid JSON
-        if np.isnan(obj) or np.isinf(obj):
-            return 0
-        return float(obj)
-    elif isinstance(obj, (np.ndarray,)):
-        # Replace NaN values in arrays
-        arr = np.array(obj)
-        arr = np.nan_to_num(arr, nan=0.0, posinf=0.0, neginf=0.0)
-        return arr.tolist()
-    elif isinstance(obj, (pd.Timestamp,)):
-        return obj.isoformat()
-    elif isinstance(obj, (timedelta,)):
-        return obj.total_seconds()
-    return str(obj)
-
-
-def sanitize_for_json(obj):
-    """Recursively sanitize data to ensure all NaN/Inf values are replaced with 0."""
-    if isinstance(obj, dict):
-        return {k: sanitize_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [sanitize_for_json(item) for item in obj]
-    elif isinstance(obj, float):
-        if np.isnan(obj) or np.isinf(obj):
-            return 0
-        return obj
-    elif isinstance(obj, (np.float64, np.float32)):
-        if np.isnan(obj) or np.isinf(obj):
-            return 0
-        return float(obj)
-    elif isinstance(obj, (np.int64, np.int32, np.int16, np.int8)):
-        return int(obj)
-    elif isinstance(obj, np.ndarray):
-        arr = np.nan_to_num(obj, nan=0.0, posinf=0.0, neginf=0.0)
-        return arr.tolist()
-    else:
-        return obj
+    serializer = _SERIALIZERS.get(type(obj))
+    return serializer(obj) if serializer is not None else str(obj)
+
+
+# Sessions aren't hashable, so the color memoizer keys on id(session) and
+# resolves the object through this registry
+_session_registry = {}
+
+
+@lru_cache(maxsize=256)
+def _driver_color(driver_code, session_id):
+    """Memoized fastf1 color lookup - get_driver_color re-inspects the session
+    on every call otherwise."""
+    return fastf1.plotting.get_driver_color(driver_code, session=_session_registry[session_id])
+
+
+def _dumps(obj):
+    # OPT_NON_STR_KEYS: lapTiming is keyed by integer lap numbers, which
+    # orjson refuses to serialize otherwise
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                        default=convert_to_json_serializable)
+
+
+def _stream_json(path, output_data):
+    """Write the telemetry JSON incrementally, one channel array at a time.
+
+    Serializing the whole payload with a single dumps() call holds both the
+    Python objects and the full JSON bytes in memory at once; streaming each
+    channel as its own orjson chunk keeps the peak at ~one channel.
+    """
+    frames = output_data["frames"]
+    with open(path, 'wb') as f:
+        f.write(b'{')
+        # Small top-level sections (event, track, drivers, ...) in one chunk each
+        for key, value in output_data.items():
+            if key == "frames":
+                continue
+            f.write(_dumps(key) + b':' + _dumps(value) + b',')
+        # The frame channels are the bulk of the file - flush one array per chunk
+        f.write(b'"frames":{')
+        first = True
+        for key, value in frames.items():
+            if not first:
+                f.write(b',')
+            first = False
+            f.write(_dumps(key) + b':')
+            if isinstance(value, dict):
+                # drivers (nested per-driver channel dicts), scales, weather
+                f.write(b'{')
+                inner_first = True
+                for name, entry in value.items():
+                    if not inner_first:
+                        f.write(b',')
+                    inner_first = False
+                    f.write(_dumps(name) + b':')
+                    if isinstance(entry, dict):
+                        f.write(b'{')
+                        channel_first = True
+                        for channel, arr in entry.items():
+                            if not channel_first:
+                                f.write(b',')
+                            channel_first = False
+                            f.write(_dumps(channel) + b':' + _dumps(arr))
+                        f.write(b'}')
+                    else:
+                        f.write(_dumps(entry))
+                f.write(b'}')
+            else:
+                f.write(_dumps(value))
+        f.write(b'}}')
+
+
+def _write_msgpack_sidecar(path, channels):
+    """Write the frame channels as a binary MessagePack sidecar.
+
+    Each ndarray is stored as its raw bytes plus dtype/shape, so the browser
+    can wrap the buffer in a typed array (e.g. Uint16Array for speed) with no
+    JSON parse at all.
+    """
+    def _pack(arr):
+        return {"data": arr.tobytes(), "dtype": str(arr.dtype), "shape": list(arr.shape)}
+
+    payload = {
+        "t": _pack(channels["t"]),
+        "lap": _pack(channels["lap"]),
+        "drivers": {
+            code: {name: _pack(arr) for name, arr in driver.items()}
+            for code, driver in channels["drivers"].items()
+        },
+    }
+    if "scales" in channels:
+        payload["scales"] = channels["scales"]
+    if "weather" in channels:
+        payload["weather"] = {name: _pack(arr) for name, arr in channels["weather"].items()}
+
+    with open(path, 'wb') as f:
+        f.write(msgpack.packb(payload, use_bin_type=True))
+
 
 def generate_round_data(year, round_number, session_type='R'):
     print(f"Loading Session: {year} Round {round_number} ({session_type})")
-    session = load_session(year, round_number, session_type)
-
-    # Basic Info
-    event_info = {
-        "eventName": session.event.EventName,
-        "roundNumber": int(session.event.RoundNumber),
-        "country": session.event.Country,
-        "location": session.event.Location,
-        "sessionType": session_type,
-        "year": year
-    }
 
-    print("Processing telemetry (this may take a few minutes)...")
-    
-    # Get full race telemetry using existing logic
-    race_data = get_race_telemetry(session, session_type=session_type)
-    
-    # Track map data (using fastest lap)
-    fastest_lap = session.laps.pick_fastest()
-    track_telemetry = fastest_lap.get_telemetry()
-    track_map = {
-        "x": track_telemetry['X'].tolist(),
-        "y": track_telemetry['Y'].tolist()
-    }
+    # Fire the OpenF1 session lookup in the background: it doesn't depend on
+    # any FastF1 data, so its HTTPS latency hides inside the heavy session
+    # load / telemetry processing below
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        session_key_future = executor.submit(get_openf1_session_key, year, round_number, session_type)
 
-    # Driver info - build list and number-to-code mapping
-    drivers = session.drivers
-    driver_list = []
-    driver_number_to_code = {}  # For mapping team radio driver numbers to codes
-    
-    for driver_id in drivers:
-        drv = session.get_driver(driver_id)
-        driver_code = drv['Abbreviation']
-        driver_num = str(drv['DriverNumber'])
-        
-        driver_list.append({
-            "code": driver_code,
-            "number": driver_num,
-            "color": fastf1.plotting.get_driver_color(driver_code, session=session),
-            "team": drv['TeamName'],
-            "fullName": drv['FullName']
-        })
-        driver_number_to_code[int(drv['DriverNumber'])] = driver_code
+        session = load_session(year, round_number, session_type)
 
-    # Sample frames for web (every 10th frame to reduce file size)
-    sampled_frames = race_data['frames'][::10]
+        # Basic Info
+        event_info = {
+            "eventName": session.event.EventName,
+            "roundNumber": int(session.event.RoundNumber),
+            "country": session.event.Country,
+            "location": session.event.Location,
+            "sessionType": session_type,
+            "year": year
+        }
+
+        print("Processing telemetry (this may take a few minutes)...")
     
-    # Fetch team radio from OpenF1 API (2023+ only)
-    print("\nFetching team radio from OpenF1...")
-    session_key = get_openf1_session_key(year, round_number, session_type)
+        # Get full race telemetry as columnar channel arrays (NaN/Inf already
+        # cleaned at the array level)
+        race_data = get_race_channels(session, session_type=session_type)
+
+        # Track map data (using fastest lap)
+        fastest_lap = session.laps.pick_fastest()
+        track_telemetry = fastest_lap.get_telemetry()
+        # Keep the coordinates as float32 ndarrays instead of Python float lists;
+        # orjson serializes them straight from the numpy buffer
+        track_map = {
+            "x": np.nan_to_num(track_telemetry['X'].to_numpy(dtype=np.float32), copy=False, nan=0.0, posinf=0.0, neginf=0.0),
+            "y": np.nan_to_num(track_telemetry['Y'].to_numpy(dtype=np.float32), copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        }
+
+        # Driver info - one pass over the pre-materialized metadata
+        _session_registry[id(session)] = session
+        drivers_meta = [session.get_driver(d) for d in session.drivers]
+        driver_list = [
+            {
+                "code": drv['Abbreviation'],
+                "number": str(drv['DriverNumber']),
+                "color": _driver_color(drv['Abbreviation'], id(session)),
+                "team": drv['TeamName'],
+                "fullName": drv['FullName']
+            }
+            for drv in drivers_meta
+        ]
+        # For mapping team radio driver numbers to codes
+        driver_number_to_code = {int(drv['DriverNumber']): drv['Abbreviation'] for drv in drivers_meta}
+
+        # Sample every 10th frame for web to reduce file size. The strided slice
+        # is compacted with ascontiguousarray (one small copy of the reduced
+        # data): orjson only serializes C-contiguous arrays from the buffer and
+        # would otherwise fall back to building Python lists per channel
+        channels = race_data['channels']
+        sampled_channels = {
+            "t": np.ascontiguousarray(channels["t"][::10]),
+            "lap": np.ascontiguousarray(channels["lap"][::10]),
+            "drivers": {
+                code: {name: np.ascontiguousarray(arr[::10]) for name, arr in driver.items()}
+                for code, driver in channels["drivers"].items()
+            },
+        }
+        if "scales" in channels:
+            sampled_channels["scales"] = channels["scales"]
+        if "weather" in channels:
+            sampled_channels["weather"] = {
+                name: np.ascontiguousarray(arr[::10]) for name, arr in channels["weather"].items()
+            }
+
+
+        # Fetch team radio from OpenF1 API (2023+ only); the session key lookup
+        # was started before the telemetry processing and is long done by now
+        print("\nFetching team radio from OpenF1...")
+        session_key = session_key_future.result()
     raw_team_radio = fetch_team_radio(session_key)
     
     # Add driver codes to team radio clips
@@ -287,7 +480,7 @@ def generate_round_data(year, round_number, session_type='R'):
         "trackStatuses": race_data['track_statuses'],
         "totalLaps": race_data['total_laps'],
         "lapTiming": race_data.get('lap_timing', {}),  # Lap times, sectors, grid positions
-        "frames": sampled_frames,
+        "frames": sampled_channels,  # Columnar: t/lap arrays + per-driver channel arrays
         "frameRate": 2.5,  # 25 FPS / 10 = 2.5 FPS sampled
         "teamRadio": team_radio  # Team radio clips with timestamps
     }
@@ -298,26 +491,49 @@ def generate_round_data(year, round_number, session_type='R'):
         os.makedirs(output_dir)
 
     output_file = f"{output_dir}/race_telemetry.json"
-    # Sanitize to ensure no NaN/Inf values that break JSON parsing
-    sanitized_data = sanitize_for_json(output_data)
-    with open(output_file, 'w') as f:
-        json.dump(sanitized_data, f, default=convert_to_json_serializable)
+    # Stream the payload channel-by-channel so the serialized JSON never has
+    # to exist in memory all at once
+    _stream_json(output_file, output_data)
 
     print(f"Full telemetry saved to {output_file}")
+
+    # Also emit a pre-compressed copy - numeric JSON gzips ~5-10x, so web
+    # servers can serve the .gz artifact directly instead of compressing
+    # per request
+    with open(output_file, 'rb') as src, gzip.open(f"{output_file}.gz", 'wb', compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+
+    print(f"Compressed telemetry saved to {output_file}.gz")
+
+    # Binary sidecar of the frame channels - roughly half the bytes of the
+    # gzipped JSON and typed-array readable without parsing
+    sidecar_file = f"{output_dir}/race_telemetry.msgpack"
+    _write_msgpack_sidecar(sidecar_file, sampled_channels)
+    print(f"Binary channel sidecar saved to {sidecar_file}")
     
-    # Also save a smaller metadata file
+    # Also save a smaller metadata file. The full track polyline at indent=2
+    # made this "light" file nearly telemetry-sized: a 1-in-20 downsample is
+    # plenty for the archive preview, and trackBounds gives the UI its
+    # framing box without walking the polyline
     meta_file = f"{output_dir}/race_data.json"
     meta_data = {
         "event": event_info,
-        "track": track_map,
+        "track": {"x": track_map["x"][::20], "y": track_map["y"][::20]},
+        "trackBounds": [float(track_map["x"].min()), float(track_map["x"].max()),
+                        float(track_map["y"].min()), float(track_map["y"].max())],
         "drivers": driver_list,
         "totalLaps": race_data['total_laps'],
-        "totalFrames": len(sampled_frames)
+        "totalFrames": len(sampled_channels["t"])
     }
     with open(meta_file, 'w') as f:
-        json.dump(meta_data, f, indent=2, default=convert_to_json_serializable)
+        json.dump(meta_data, f, default=convert_to_json_serializable)
     
     print(f"Metadata saved to {meta_file}")
 
 if __name__ == "__main__":
-    generate_round_data(2025, 12, 'R')
+    if "--refresh-radio" in sys.argv:
+        clear_openf1_cache()
+    try:
+        generate_round_data(2025, 12, 'R')
+    finally:
+        _HTTP.close()
@@ -208,23 +208,13 @@ def get_lap_timing_data(session):
     
     return lap_data
 
-def get_race_telemetry(session, session_type='R'):
-
-    event_name = str(session).replace(' ', '_')
-    cache_suffix = 'sprint' if session_type == 'S' else 'race'
-
-    # Check if this data has already been computed
-
-    try:
-        if "--refresh-data" not in sys.argv:
-            with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "rb") as f:
-                frames = pickle.load(f)
-                print(f"Loaded precomputed {cache_suffix} telemetry data.")
-                print("The replay should begin in a new window shortly!")
-                return frames
-    except FileNotFoundError:
-        pass  # Need to compute from scratch
+def _resample_race_telemetry(session):
+    """Extract and resample every driver's telemetry onto a common timeline.
 
+    Returns (timeline, resampled_data, formatted_track_statuses,
+    weather_resampled, max_lap_number). Shared by the frame-based arcade
+    path and the columnar web-export path.
+    """
 
     drivers = session.drivers
 
@@ -376,10 +366,33 @@ def get_race_telemetry(session, session_type='R'):
         except Exception as e:
             print(f"Weather data could not be processed: {e}")
 
+    return timeline, resampled_data, formatted_track_statuses, weather_resampled, max_lap_number
+
+
+def get_race_telemetry(session, session_type='R'):
+
+    event_name = str(session).replace(' ', '_')
+    cache_suffix = 'sprint' if session_type == 'S' else 'race'
+
+    # Check if this data has already been computed
+
+    try:
+        if "--refresh-data" not in sys.argv:
+            with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "rb") as f:
+                frames = pickle.load(f)
+                print(f"Loaded precomputed {cache_suffix} telemetry data.")
+                print("The replay should begin in a new window shortly!")
+                return frames
+    except FileNotFoundError:
+        pass  # Need to compute from scratch
+
+    timeline, resampled_data, formatted_track_statuses, weather_resampled, max_lap_number = \
+        _resample_race_telemetry(session)
+
     # 5. Build the frames + LIVE LEADERBOARD
     frames = []
     num_frames = len(timeline)
-    
+
     # Pre-extract data references for faster access
     driver_codes = list(resampled_data.keys())
     driver_arrays = {code: resampled_data[code] for code in driver_codes}
@@ -475,26 +488,138 @@ def get_race_telemetry(session, session_type='R'):
     print("Extracting lap timing data...")
     lap_timing_data = get_lap_timing_data(session)
 
+    data = {
+        "frames": frames,
+        "driver_colors": get_driver_colors(session),
+        "track_statuses": formatted_track_statuses,
+        "total_laps": int(max_lap_number),
+        "lap_timing": lap_timing_data,
+    }
+
     # Save using pickle (10-100x faster than JSON)
     with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "wb") as f:
-        pickle.dump({
-            "frames": frames,
-            "driver_colors": get_driver_colors(session),
-            "track_statuses": formatted_track_statuses,
-            "total_laps": int(max_lap_number),
-            "lap_timing": lap_timing_data,
-        }, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     print("Saved Successfully!")
     print("The replay should begin in a new window shortly")
-    return {
-        "frames": frames,
+    return data
+
+
+def get_race_channels(session, session_type='R'):
+    """Columnar (structure-of-arrays) variant of get_race_telemetry.
+
+    Instead of building one dict per frame, every telemetry channel stays a
+    numpy array over the common timeline - much cheaper to produce and to
+    serialize for the web dashboard. Returns the same top-level keys as
+    get_race_telemetry, with "frames" replaced by "channels":
+
+        {
+            "t": ndarray,                  # frame times (s)
+            "lap": ndarray,                # leader's lap per frame
+            "drivers": {code: {channel: ndarray, ...}},
+            "scales": {channel: factor},   # quantized channels (x/y) decode factors
+            "weather": {channel: ndarray, ...},  # only if weather data exists
+        }
+
+    Channels are down-cast to compact dtypes (uint8/uint16/float32; x/y as
+    quantized int32) to keep the serialized payload small.
+    """
+
+    event_name = str(session).replace(' ', '_')
+    cache_suffix = 'sprint_channels' if session_type == 'S' else 'race_channels'
+
+    # Check if this data has already been computed
+
+    try:
+        if "--refresh-data" not in sys.argv:
+            with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "rb") as f:
+                data = pickle.load(f)
+                print(f"Loaded precomputed {cache_suffix} telemetry data.")
+                return data
+    except FileNotFoundError:
+        pass  # Need to compute from scratch
+
+    timeline, resampled_data, formatted_track_statuses, weather_resampled, max_lap_number = \
+        _resample_race_telemetry(session)
+
+    driver_codes = list(resampled_data.keys())
+    num_frames = len(timeline)
+
+    # Positions for all frames at once: rank every driver by race distance
+    # per column instead of sorting a snapshot list per frame
+    dist_matrix = np.vstack([resampled_data[code]["dist"] for code in driver_codes])
+    lap_matrix = np.rint(np.vstack([resampled_data[code]["lap"] for code in driver_codes])).astype(int)
+    order = np.argsort(-dist_matrix, axis=0)
+    frame_idx = np.arange(num_frames)
+    positions = np.empty_like(order)
+    positions[order, frame_idx] = np.arange(1, len(driver_codes) + 1)[:, None]
+
+    # Leader's lap per frame (row 0 of the ordering is the leader)
+    leader_lap = lap_matrix[order[0], frame_idx] if len(driver_codes) else np.zeros(num_frames, dtype=int)
+
+    def _clean(arr):
+        return np.nan_to_num(arr, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # Down-cast every channel to the smallest dtype that holds it - the
+    # defaults are float64, but speed fits in uint16, gear/drs/throttle in
+    # uint8 etc., which halves or quarters the serialized payload. The x/y
+    # coordinates are quantized to tenths and carry a "scales" entry so the
+    # frontend can multiply them back.
+    driver_channels = {}
+    for row, code in enumerate(driver_codes):
+        d = resampled_data[code]
+        driver_channels[code] = {
+            "x": np.rint(_clean(d["x"]) * 10).astype(np.int32),
+            "y": np.rint(_clean(d["y"]) * 10).astype(np.int32),
+            "dist": _clean(d["dist"]).astype(np.float32),
+            "lap": lap_matrix[row].astype(np.uint16),
+            "rel_dist": np.round(_clean(d["rel_dist"]), 4).astype(np.float32),
+            "tyre": np.rint(_clean(d["tyre"])).astype(np.uint8),
+            "position": positions[row].astype(np.uint8),
+            "speed": np.rint(_clean(d["speed"])).astype(np.uint16),
+            "gear": np.rint(_clean(d["gear"])).astype(np.uint8),
+            "drs": np.rint(_clean(d["drs"])).astype(np.uint8),
+            "throttle": np.rint(_clean(d["throttle"])).astype(np.uint8),
+            "brake": np.rint(_clean(d["brake"])).astype(np.uint8),
+        }
+
+    channels = {
+        "t": np.round(timeline, 3),
+        "lap": leader_lap.astype(np.uint16),
+        "drivers": driver_channels,
+        "scales": {"x": 0.1, "y": 0.1},
+    }
+
+    if weather_resampled:
+        channels["weather"] = {
+            name: _clean(arr).astype(np.float32)
+            for name, arr in weather_resampled.items() if arr is not None
+        }
+
+    print("completed telemetry extraction...")
+    print("Saving to cache file...")
+    # If computed_data/ directory doesn't exist, create it
+    if not os.path.exists("computed_data"):
+        os.makedirs("computed_data")
+
+    # Get lap timing data (lap times, sectors, grid positions)
+    print("Extracting lap timing data...")
+    lap_timing_data = get_lap_timing_data(session)
+
+    data = {
+        "channels": channels,
         "driver_colors": get_driver_colors(session),
         "track_statuses": formatted_track_statuses,
         "total_laps": int(max_lap_number),
         "lap_timing": lap_timing_data,
     }
 
+    with open(f"computed_data/{event_name}_{cache_suffix}_telemetry.pkl", "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    print("Saved Successfully!")
+    return data
+
 
 def get_qualifying_results(session):
 